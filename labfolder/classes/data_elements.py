@@ -4,15 +4,31 @@ and updating data elements via the LabFolder API.
 """
 
 import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import requests
-from PIL import Image
 
-from labfolder.classes.labfolder_access import LabFolderUserInfo
+from labfolder.classes.labfolder_access import (
+    LabFolderUserInfo,
+    _json_dumps,
+    _json_loads,
+)
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_ELEMENT_LOADERS = {
+    "DATA": "load_data",
+    "IMAGE": "load_image",
+    "TEXT": "load_text",
+    "TABLE": "load_table",
+    "DATA_ELEMENT_GROUP": "load_all",
+}
 
 
 class DataElement:
@@ -32,6 +48,8 @@ class DataElement:
         description (str): The description of the data element.
     """
 
+    __slots__ = ("type", "element_id", "description")
+
     def __init__(self, element_id="", description=""):
         """Initialize a new data element with the specified ID and description.
 
@@ -61,16 +79,12 @@ class DataElement:
                 updates the object's `description` and `element_id` attributes with
                 the retrieved data.
         """
-        if element_id == "":
+        if not element_id:
             element_id = self.element_id
-        if element_id == "":
-            print("No data ID provided.")
+        if not element_id:
+            logger.warning("No data ID provided.")
             return None
-        data = requests.get(
-            f"{user_info.api_address}elements/data/{element_id}",
-            headers=user_info.auth_token,
-            timeout=10,
-        ).json()
+        data = user_info.cached_get(f"{user_info.url_data}/{element_id}", ttl=30)
         self.description = data["description"]
         self.element_id = data["id"]
         return None
@@ -88,22 +102,22 @@ class DataElement:
             None
 
         Notes:
-            If `entry_id` is not provided, the function prints a message and returns None.
+            If `entry_id` is not provided, the function logs a warning and returns None.
             On successful write (HTTP 201), sets `self.element_id` to the returned element ID.
-            Otherwise, prints an error message and the response text.
+            Otherwise, logs a warning with the status code.
         """
-        if entry_id == "":
-            print("No entry_id provided.")
+        if not entry_id:
+            logger.warning("No entry_id provided.")
             return None
-        response = requests.post(
-            f"{user_info.api_address}elements/data",
-            headers=user_info.auth_token,
-            json={"entry_id": entry_id, "description": self.description},
-            timeout=10,
+        response = user_info.session.post(
+            user_info.url_data,
+            headers=_JSON_HEADERS,
+            data=_json_dumps({"entry_id": entry_id, "description": self.description}),
+            timeout=user_info.timeout,
         )
         status = _handle_response(self, response, return_status=True)
         if status:
-            self.element_id = response.json()["id"]
+            self.element_id = _json_loads(response.content)["id"]
         return None
 
     def update_on_labfolder(self, user_info: LabFolderUserInfo):
@@ -117,22 +131,31 @@ class DataElement:
             None: This method does not return anything.
 
         Notes:
-            - If the description is empty, the method prints a message and returns without
+            - If the description is empty, the method logs a warning and returns without
               making a request.
-            - Prints a message indicating whether the update was successful or not.
+            - Logs a message indicating whether the update was successful or not.
         """
-        if self.description == "":
-            print("No data to write.")
+        if not self.description:
+            logger.warning("No data to write.")
             return None
-        response = requests.put(
-            f"{user_info.api_address}elements/data/{self.element_id}",
-            headers=user_info.auth_token,
-            json={"id": self.element_id, "description": self.description},
-            timeout=10,
+        response = user_info.session.put(
+            f"{user_info.url_data}/{self.element_id}",
+            headers=_JSON_HEADERS,
+            data=_json_dumps({"id": self.element_id, "description": self.description}),
+            timeout=user_info.timeout,
         )
+        user_info.invalidate_cache(f"{user_info.url_data}/{self.element_id}")
         _handle_response(self, response)
         return None
 
+    def clone(self):
+        """Create an independent copy of the data element.
+
+        Returns:
+            DataElement: A new DataElement with the same ID and description.
+        """
+        return DataElement(element_id=self.element_id, description=self.description)
+
     def __repr__(self):
         """Return a string representation of the DataElement instance.
 
@@ -159,6 +182,8 @@ class DescriptiveDataElement:
         description (str): The description of the data element.
     """
 
+    __slots__ = ("type", "title", "element_id", "description")
+
     def __init__(self, title="", element_id="", description=""):
         self.type = "DESCRIPTIVE_DATA_ELEMENT"
         self.title = title
@@ -173,6 +198,17 @@ class DescriptiveDataElement:
         """
         return {"type": self.type, "title": self.title, "description": self.description}
 
+    def clone(self):
+        """Create an independent copy of the descriptive data element.
+
+        Returns:
+            DescriptiveDataElement: A new element with the same title, ID, and
+                description.
+        """
+        return DescriptiveDataElement(
+            title=self.title, element_id=self.element_id, description=self.description
+        )
+
     def __repr__(self):
         """Return a string representation of the DataElement instance.
 
@@ -193,6 +229,8 @@ class FileElement:
         element_id (str): The unique identifier for the file element.
     """
 
+    __slots__ = ("type", "element_id")
+
     def __init__(self, element_id):
         """Initialize a new instance of the class with the specified element ID.
 
@@ -202,6 +240,14 @@ class FileElement:
         self.type = "FILE"
         self.element_id = element_id
 
+    def clone(self):
+        """Create an independent copy of the file element.
+
+        Returns:
+            FileElement: A new FileElement with the same element ID.
+        """
+        return FileElement(element_id=self.element_id)
+
     def __repr__(self):
         """Return a string representation of the DataElement instance.
 
@@ -224,6 +270,16 @@ class ImageElement:
         owner_id (str): The ID of the owner of the image element.
     """
 
+    __slots__ = (
+        "type",
+        "title",
+        "element_id",
+        "original_file_content_type",
+        "creation_date",
+        "image",
+        "owner_id",
+    )
+
     def __init__(self, title="", element_id="", original_file_content_type="image/png"):
         """Initialize an IMAGE data element with optional metadata.
 
@@ -256,28 +312,27 @@ class ImageElement:
 
         Notes:
             - Updates the object's `title`, `owner_id`, `creation_date`, and `image` attributes.
-            - Prints a message and returns None if no image ID is provided.
+            - Logs a warning and returns None if no image ID is provided.
         """
 
-        if element_id == "":
+        if not element_id:
             element_id = self.element_id
-        if element_id == "":
-            print("No image ID provided.")
+        if not element_id:
+            logger.warning("No image ID provided.")
             return None
-        image_info = requests.get(
-            user_info.api_address + f"elements/image/{element_id}",
-            headers=user_info.auth_token,
-            timeout=10,
-        ).json()
-        image = requests.get(
-            user_info.api_address + f"elements/image/{element_id}/original-data",
-            headers=user_info.auth_token,
-            timeout=10,
+        from PIL import Image
+
+        image_info = user_info.get_json(f"{user_info.url_image}/{element_id}")
+        image = user_info.session.get(
+            f"{user_info.url_image}/{element_id}/original-data",
+            headers={"Accept": "*/*"},
+            timeout=user_info.timeout,
         )
+        image.raise_for_status()
+        self.image = Image.open(io.BytesIO(image.content))
         self.title = image_info["title"]
         self.owner_id = image_info["owner_id"]
         self.creation_date = image_info["creation_date"]
-        self.image = Image.open(io.BytesIO(image.content))
         return None
 
     def show_image(self):
@@ -287,18 +342,87 @@ class ImageElement:
             None: This method does not return any value.
 
         Notes:
-            If the image attribute is None, prints a message and returns None.
+            If the image attribute is None, logs a warning and returns None.
             Otherwise, displays the image without axes.
         """
         if self.image is None:
-            print("No image to show.")
+            logger.warning("No image to show.")
             return None
+        import matplotlib.pyplot as plt
+
         plt.imshow(self.image)
         plt.axis("off")
         plt.show()
         return None
 
-    # TODO: Implement write_to_labfolder - it probably has to be written as file (?)
+    def write_to_labfolder(self, user_info: LabFolderUserInfo, entry_id=""):
+        """Writes the image to Labfolder as a new image element.
+
+        Args:
+            user_info (LabFolderUserInfo): An object containing the user's Labfolder
+                API address and authentication token.
+            entry_id (str, optional): The ID of the Labfolder entry to which the image
+                should be written. Default is an empty string.
+
+        Returns:
+            None
+
+        Notes:
+            - If `entry_id` is not provided or no image is loaded, the method logs a
+              warning and returns None.
+            - The image is encoded once in the format given by
+              `original_file_content_type` and sent as a multipart/form-data upload.
+            - On successful write (HTTP 201), sets `self.element_id` to the returned
+              element ID.
+        """
+        if not entry_id:
+            logger.warning("No entry_id provided.")
+            return None
+        if self.image is None:
+            logger.warning("No image to write.")
+            return None
+        from PIL import Image
+
+        Image.init()
+        image_format = next(
+            (
+                name
+                for name, mime in Image.MIME.items()
+                if mime == self.original_file_content_type
+            ),
+            self.image.format or "PNG",
+        )
+        buffer = io.BytesIO()
+        self.image.save(buffer, format=image_format)
+        buffer.seek(0)
+        response = user_info.session.post(
+            user_info.url_image,
+            data={"entry_id": entry_id, "title": self.title},
+            files={"file": (self.title, buffer, self.original_file_content_type)},
+            timeout=30,
+        )
+        status = _handle_response(self, response, return_status=True)
+        if status:
+            self.element_id = _json_loads(response.content)["id"]
+        return None
+
+    def clone(self):
+        """Create an independent copy of the image element.
+
+        Returns:
+            ImageElement: A new ImageElement with the same metadata and a copy of
+                the loaded image, if any.
+        """
+        clone = ImageElement(
+            title=self.title,
+            element_id=self.element_id,
+            original_file_content_type=self.original_file_content_type,
+        )
+        clone.creation_date = self.creation_date
+        clone.owner_id = self.owner_id
+        if self.image is not None:
+            clone.image = self.image.copy()
+        return clone
 
     def __repr__(self):
         """Return a string representation of the DataElement instance.
@@ -327,6 +451,8 @@ class TextElement:
         content (str): The textual content of the element.
     """
 
+    __slots__ = ("type", "element_id", "content", "id")
+
     def __init__(self, content="", element_id=""):
         """Initialize a new instance of the class.
 
@@ -360,16 +486,12 @@ class TextElement:
         This method sends a GET request to the LabFolder API to retrieve the text
         content of the specified element.
         """
-        if element_id == "":
+        if not element_id:
             element_id = self.element_id
-        if element_id == "":
-            print("No text ID provided.")
+        if not element_id:
+            logger.warning("No text ID provided.")
             return None
-        text = requests.get(
-            f"{user_info.api_address}elements/text/{element_id}",
-            headers=user_info.auth_token,
-            timeout=10,
-        ).json()
+        text = user_info.cached_get(f"{user_info.url_text}/{element_id}", ttl=30)
         self.content = text["content"]
         self.element_id = text["id"]
         return None
@@ -388,23 +510,23 @@ class TextElement:
 
         Notes:
         -----
-        If the `entry_id` is not provided, the method prints a message and returns `None`.
+        If the `entry_id` is not provided, the method logs a warning and returns `None`.
         On successful creation (HTTP 201), the method updates the object's `id`
         attribute with the ID returned by Labfolder.
-        Otherwise, it prints an error message with the status code and response text.
+        Otherwise, it logs a warning with the status code.
         """
-        if entry_id == "":
-            print("No entry_id provided.")
+        if not entry_id:
+            logger.warning("No entry_id provided.")
             return None
-        response = requests.post(
-            f"{user_info.api_address}elements/text",
-            headers=user_info.auth_token,
-            json={"entry_id": entry_id, "content": self.content},
-            timeout=10,
+        response = user_info.session.post(
+            user_info.url_text,
+            headers=_JSON_HEADERS,
+            data=_json_dumps({"entry_id": entry_id, "content": self.content}),
+            timeout=user_info.timeout,
         )
         status = _handle_response(self, response, return_status=True)
         if status:
-            self.id = response.json()["id"]
+            self.id = _json_loads(response.content)["id"]
         return None
 
     def update_on_labfolder(self, user_info: LabFolderUserInfo):
@@ -419,23 +541,34 @@ class TextElement:
 
         Notes:
         -----
-        If the content is empty, the method prints a message and returns without
+        If the content is empty, the method logs a warning and returns without
         making a request.
-        Prints the result of the update operation, including the status code and
-        response text if the update fails.
+        Logs the result of the update operation, including the status code if
+        the update fails.
         """
-        if self.content == "":
-            print("No text to write.")
+        if not self.content:
+            logger.warning("No text to write.")
             return None
-        response = requests.put(
-            f"{user_info.api_address}elements/text/{self.element_id}",
-            headers=user_info.auth_token,
-            json={"id": self.element_id, "content": self.content},
-            timeout=10,
+        response = user_info.session.put(
+            f"{user_info.url_text}/{self.element_id}",
+            headers=_JSON_HEADERS,
+            data=_json_dumps({"id": self.element_id, "content": self.content}),
+            timeout=user_info.timeout,
         )
+        user_info.invalidate_cache(f"{user_info.url_text}/{self.element_id}")
         _handle_response(self, response)
         return None
 
+    def clone(self):
+        """Create an independent copy of the text element.
+
+        Returns:
+            TextElement: A new TextElement with the same content and IDs.
+        """
+        clone = TextElement(content=self.content, element_id=self.element_id)
+        clone.id = self.id
+        return clone
+
     def __repr__(self):
         """Return a string representation of the DataElement instance.
 
@@ -463,6 +596,8 @@ class DataElementGroup:
         children (list): The list of child data elements.
     """
 
+    __slots__ = ("type", "title", "element_id", "children")
+
     def __init__(self, title="", children=None):
         """Initialize a DATA_ELEMENT_GROUP instance.
 
@@ -492,6 +627,37 @@ class DataElementGroup:
         """
         self.children.append(child)
 
+    def load_all(self, user_info: LabFolderUserInfo, max_workers=8):
+        """Load all children of the group from Labfolder concurrently.
+
+        Args:
+            user_info (LabFolderUserInfo): An object containing user authentication
+                information and API address.
+            max_workers (int, optional): The maximum number of children loaded at the
+                same time. Defaults to 8.
+
+        Returns:
+            None
+
+        Notes:
+            - The requests are I/O bound, so a thread pool sharing the pooled session
+              of `user_info` overlaps their round trips instead of paying them one
+              after another.
+            - Nested groups load their own children in the same way. Children without
+              a loader (e.g. FILE or DESCRIPTIVE_DATA_ELEMENT) are skipped with a
+              warning. Descriptive children have no endpoint of their own; they are
+              parsed with the entry and only sent through the group's own POST/PUT.
+        """
+        if not self.children:
+            return None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda child: _load_element(child, user_info), self.children
+                )
+            )
+        return None
+
     def to_dict(self):
         """Convert the object and its children into a dictionary representation.
 
@@ -514,7 +680,7 @@ class DataElementGroup:
             information and API address for Labfolder.
             entry_id (str, optional): The ID of the Labfolder entry to which the data
             element should be written. If not provided or empty, the function will
-            print a message and return None.
+            log a warning and return None.
 
         Returns:
             None
@@ -522,23 +688,74 @@ class DataElementGroup:
         Notes:
             If the data element group is successfully written to Labfolder (HTTP status
             code 201), the `element_id` attribute of the object is updated with the
-            returned ID. Otherwise, an error message and the response text are printed.
+            returned ID. Otherwise, a warning with the status code is logged.
         """
-        if entry_id == "":
-            print("No entry_id provided.")
+        if not entry_id:
+            logger.warning("No entry_id provided.")
             return None
         content = {
             "entry_id": entry_id,
             "data_elements": [self.to_dict()],
             "locked": False,
         }
-        response = requests.post(
-            f"{user_info.api_address}elements/data",
-            headers=user_info.auth_token,
-            json=content,
-            timeout=10,
+        response = user_info.session.post(
+            user_info.url_data,
+            headers=_JSON_HEADERS,
+            data=_json_dumps(content),
+            timeout=user_info.timeout,
         )
-        _handle_response(self, response)
+        status = _handle_response(self, response, return_status=True)
+        if status:
+            self.element_id = _json_loads(response.content)["id"]
+        return None
+
+    def write_all(self, user_info: LabFolderUserInfo, entry_id="", max_workers=8):
+        """
+        Write every child of the group to Labfolder as a separate element.
+
+        Args:
+            user_info (LabFolderUserInfo): An object containing user authentication
+            information and API address for Labfolder.
+            entry_id (str, optional): The ID of the Labfolder entry to which the
+            children should be written. If not provided or empty, the function will
+            log a warning and return None.
+            max_workers (int, optional): The maximum number of children written at
+            the same time. Defaults to 8.
+
+        Returns:
+            None
+
+        Notes:
+            - Use this when the children have to be created one by one. Otherwise
+              `write_to_labfolder` sends the whole group in a single request.
+            - The POST requests run on a thread pool sharing the pooled session of
+              `user_info`, so their round trips overlap.
+            - Children without a `write_to_labfolder` method (e.g.
+              DESCRIPTIVE_DATA_ELEMENT) are skipped with a warning. Descriptive
+              children are only sent through the group's own POST/PUT, i.e.
+              `write_to_labfolder` or `update_on_labfolder`.
+        """
+        if not entry_id:
+            logger.warning("No entry_id provided.")
+            return None
+        children = []
+        for child in self.children:
+            if hasattr(child, "write_to_labfolder"):
+                children.append(child)
+            else:
+                logger.warning(
+                    "Skipping %s child, it can only be written with its group.",
+                    child.type,
+                )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    lambda child: child.write_to_labfolder(
+                        user_info, entry_id=entry_id
+                    ),
+                    children,
+                )
+            )
         return None
 
     def update_on_labfolder(self, user_info: LabFolderUserInfo):
@@ -553,14 +770,16 @@ class DataElementGroup:
             None
 
         Notes:
-            - If `element_id` is empty, the update is not performed and a message is
-              printed.
-            - Sends a PUT request to the Labfolder API to update the data element group.
-            - Prints a message indicating whether the update was successful or not,
+            - If `element_id` is empty, the update is not performed and a warning is
+              logged.
+            - Sends a single PUT request containing the whole group, including all
+              children and nested groups. Edit the children locally and call this
+              method once instead of updating the children one by one.
+            - Logs a message indicating whether the update was successful or not,
               based on the response status code.
         """
-        if self.element_id == "":
-            print("No data element group ID provided.")
+        if not self.element_id:
+            logger.warning("No data element group ID provided.")
             return None
         content = {
             "id": self.element_id,
@@ -568,12 +787,13 @@ class DataElementGroup:
             "data_elements": [self.to_dict()],
             "locked": False,
         }
-        response = requests.put(
-            f"{user_info.api_address}elements/data/{self.element_id}",
-            headers=user_info.auth_token,
-            json=content,
-            timeout=10,
+        response = user_info.session.put(
+            f"{user_info.url_data}/{self.element_id}",
+            headers=_JSON_HEADERS,
+            data=_json_dumps(content),
+            timeout=user_info.timeout,
         )
+        user_info.invalidate_cache(f"{user_info.url_data}/{self.element_id}")
         _handle_response(self, response)
         return None
 
@@ -584,11 +804,19 @@ class DataElementGroup:
             dict: A dictionary containing the object's type, title, and a list of its
                 children's dictionary representations.
         """
-        return {
-            "type": self.type,
-            "title": self.title,
-            "children": [child.to_dict() for child in self.children],
-        }
+        return self.to_dict()
+
+    def clone(self):
+        """Create an independent copy of the group and all of its children.
+
+        Returns:
+            DataElementGroup: A new DataElementGroup with cloned children.
+        """
+        clone = DataElementGroup(
+            title=self.title, children=[child.clone() for child in self.children]
+        )
+        clone.element_id = self.element_id
+        return clone
 
     def __repr__(self):
         """Return a string representation of the DataElementGroup object.
@@ -612,7 +840,7 @@ class TableElement:
         entry_id (str, optional): The entry identifier associated with the table
             (default is '').
         table (dict, optional): The table data, either as a dictionary or pandas
-            DataFrame (default is {}).
+            DataFrame (default is None, which creates an empty dictionary).
         import_as_pd (bool, optional): Whether to import the table as a pandas
             DataFrame (default is True).
         header (bool, optional): Whether the first row should be treated as a
@@ -628,12 +856,22 @@ class TableElement:
         title (str): The title of the table.
     """
 
+    __slots__ = (
+        "type",
+        "entry_id",
+        "element_id",
+        "table",
+        "creation_date",
+        "owner_id",
+        "title",
+    )
+
     def __init__(
         self,
         user_info: LabFolderUserInfo,
         element_id="",
         entry_id="",
-        table={},
+        table=None,
         import_as_pd=True,
         header=True,
     ):
@@ -648,7 +886,7 @@ class TableElement:
             entry_id (str, optional): The identifier for the entry to which this table
             belongs. Default is an empty string.
             table (dict, optional): The table data, represented as a dictionary.
-            Default is an empty dictionary.
+            Default is None, which creates a new empty dictionary.
             import_as_pd (bool, optional): Whether to import the table as a pandas
             DataFrame. Default is True.
             header (bool, optional): Whether the table includes a header row.
@@ -666,14 +904,12 @@ class TableElement:
         self.type = "TABLE"
         self.entry_id = entry_id
         self.element_id = element_id
-        self.table = table
+        self.table = {} if table is None else table
         self.creation_date = ""
         self.owner_id = user_info.user_id if user_info is not None else ""
         self.title = ""
-        if isinstance(user_info, LabFolderUserInfo) and element_id != "":
+        if isinstance(user_info, LabFolderUserInfo) and element_id:
             self.load_table(user_info, to_pd=import_as_pd, header=header)
-            if import_as_pd:
-                self.table_to_pd(header=header)
         # TODO: Check if owner_id can be taken from somewhere else.
         # Case: user_info is not from table owner.
 
@@ -699,23 +935,19 @@ class TableElement:
               and `table` attributes.
             - Requires a valid LabFolderUserInfo object for authentication.
         """
-        if self.element_id == "":
-            print("No table ID provided.")
+        if not self.element_id:
+            logger.warning("No table ID provided.")
             return None
         if not isinstance(user_info, LabFolderUserInfo):
-            print("Not logged into Labfolder. User information required.")
+            logger.warning("Not logged into Labfolder. User information required.")
             return None
 
-        table = requests.get(
-            f"{user_info.api_address}elements/table/{self.element_id}",
-            headers=user_info.auth_token,
-            timeout=10,
-        ).json()
+        table = user_info.cached_get(f"{user_info.url_table}/{self.element_id}", ttl=30)
         self.entry_id = table["entry_id"]
         self.creation_date = table["creation_date"]
         self.owner_id = table["owner_id"]
         self.title = table["title"]
-        self.table = table["content"]["sheets"]
+        self.table = dict(table["content"]["sheets"])
         if to_pd:
             self.table_to_pd(header=header)
         return None
@@ -739,40 +971,42 @@ class TableElement:
 
         Notes:
             - If neither `entry_id` nor `self.entry_id` is provided, the function
-              prints a message and returns None.
-            - If `self.table` is None, the function prints a message and returns None.
-            - If the table cannot be converted to export format, the function prints a
-              message and returns None.
+              logs a warning and returns None.
+            - If `self.table` is None, the function logs a warning and returns None.
+            - If the table cannot be converted to export format, the function logs a
+              warning and returns None.
             - On successful upload (HTTP 201), sets `self.element_id` to the returned
               element ID.
-            - Prints status messages for success or failure.
+            - Logs status messages for success or failure.
         """
-        if entry_id == "" and self.entry_id != "":
+        if not entry_id:
             entry_id = self.entry_id
-        elif entry_id == "" and self.entry_id == "":
-            print("No entry_id provided.")
+        if not entry_id:
+            logger.warning("No entry_id provided.")
             return None
         if self.table is None:
-            print("No table to write.")
+            logger.warning("No table to write.")
             return None
         table_content = self.convert_pd_to_export(header=header)
         if table_content is None:
-            print("Could not convert table to export format.")
+            logger.warning("Could not convert table to export format.")
             return None
-        response = requests.post(
-            f"{user_info.api_address}elements/table",
-            headers=user_info.auth_token,
-            timeout=10,
-            json={
-                "entry_id": entry_id,
-                "title": self.title,
-                "content": table_content,
-                "locked": False,
-            },
+        response = user_info.session.post(
+            user_info.url_table,
+            headers=_JSON_HEADERS,
+            timeout=30,
+            data=_json_dumps(
+                {
+                    "entry_id": entry_id,
+                    "title": self.title,
+                    "content": table_content,
+                    "locked": False,
+                }
+            ),
         )
         status = _handle_response(self, response, return_status=True)
         if status:
-            self.element_id = response.json()["id"]
+            self.element_id = _json_loads(response.content)["id"]
         return None
 
     def update_on_labfolder(self, user_info: LabFolderUserInfo, header=True):
@@ -789,37 +1023,40 @@ class TableElement:
             None
 
         Notes:
-            - If `self.table` is None, the function prints a message and returns None.
-            - If the table cannot be converted to export format, the function prints a
-              message and returns None.
+            - If `self.table` is None, the function logs a warning and returns None.
+            - If the table cannot be converted to export format, the function logs a
+              warning and returns None.
             - Sends a PUT request to update the table element on Labfolder.
-            - Prints the result of the update operation.
+            - Logs the result of the update operation.
         """
         if self.table is None:
-            print("No table to write.")
+            logger.warning("No table to write.")
             return None
         table_content = self.convert_pd_to_export(header=header)
         if table_content is None:
-            print("Could not convert table to export format.")
+            logger.warning("Could not convert table to export format.")
             return None
-        response = requests.put(
-            f"{user_info.api_address}elements/table/{self.element_id}",
-            headers=user_info.auth_token,
-            timeout=10,
-            json={
-                "entry_id": self.entry_id,
-                "id": self.element_id,
-                "content": table_content,
-                "locked": False,
-            },
+        response = user_info.session.put(
+            f"{user_info.url_table}/{self.element_id}",
+            headers=_JSON_HEADERS,
+            timeout=30,
+            data=_json_dumps(
+                {
+                    "entry_id": self.entry_id,
+                    "id": self.element_id,
+                    "content": table_content,
+                    "locked": False,
+                }
+            ),
         )
+        user_info.invalidate_cache(f"{user_info.url_table}/{self.element_id}")
         _handle_response(self, response)
         return None
 
     def table_to_pd(self, header=True, in_place=True):
         """
         Converts the internal table representation to pandas DataFrames.
-        If the table is already converted to pandas DataFrames, the function prints
+        If the table is already converted to pandas DataFrames, the function logs
         a message and returns None. Otherwise, it processes each sheet in the table,
         converting its data to a pandas DataFrame, handling missing values, and
         optionally using the first row as the header.
@@ -836,7 +1073,7 @@ class TableElement:
             modifies the internal table and returns None.
 
         Notes:
-            - If the table is already in pandas DataFrame format, the function prints a
+            - If the table is already in pandas DataFrame format, the function logs a
               message and returns None.
             - Handles missing values by filling with NaN and dropping rows/columns that
               are entirely NaN.
@@ -844,8 +1081,7 @@ class TableElement:
               from the data.
         """
         if any(isinstance(element, pd.DataFrame) for element in self.table.values()):
-            print("Table already converted to pandas DataFrame.")
-            print(self.table)
+            logger.info("Table already converted to pandas DataFrame.")
             return None
 
         def table_to_pandas(table, header: bool):
@@ -864,45 +1100,32 @@ class TableElement:
                     If `header` is True, the first row is used as column headers.
 
             Notes:
-                - Any missing values are filled with `numpy.nan`.
-                - Rows and columns that are entirely empty are dropped.
-                - The DataFrame index is reset after processing.
+                - The cells are read into a dense array with
+                  `_data_table_to_array`, so sparse tables keep their layout and
+                  missing values are `numpy.nan`.
+                - Rows and columns that are entirely empty are dropped using a
+                  single missing-value mask, and the header row is split off
+                  before the DataFrame is built.
+                - Column dtypes are inferred once after the header row is removed.
             """
-            data = []
-            for row in table.keys():
-                try:
-                    data.append(
-                        {
-                            col: table[row][col].get("value", None)
-                            for col in table[row].keys()
-                        }
-                    )
-                except KeyError:
-                    data.append({col: None for col in table[row].keys()})
-            df = pd.DataFrame(data)
-            df.fillna(np.nan, inplace=True)
-            df.dropna(axis=0, how="all", inplace=True)
-            df.dropna(axis=1, how="all", inplace=True)
-            if header:
-                df.columns = df.iloc[0].tolist()
-                df.drop(0, inplace=True)
-            df.sort_index(inplace=True)
-            df.reset_index(drop=True, inplace=True)
-            return df
-
-        if in_place:
-            table = self.table
-        else:
-            table = deepcopy(self.table)
+            values = _data_table_to_array(table)
+            mask = pd.notna(values)
+            columns = np.flatnonzero(mask.any(axis=0))
+            values = values[mask.any(axis=1)][:, columns]
+            if header and len(values) > 0:
+                df = pd.DataFrame(values[1:], columns=values[0].tolist())
+            else:
+                df = pd.DataFrame(values, columns=[str(c) for c in columns])
+            return df.infer_objects()
 
         table = {
-            sheet: table_to_pandas(
-                self.table[sheet]["data"]["dataTable"], header=header
-            )
-            for sheet in self.table.keys()
+            sheet: table_to_pandas(content["data"]["dataTable"], header=header)
+            for sheet, content in self.table.items()
         }
         if not in_place:
             return table
+        self.table = table
+        return None
 
     def add_sheet(self, sheet_name: str, table: pd.DataFrame) -> None:
         """Add a new sheet to the table dictionary with the given sheet name and DataFrame.
@@ -913,7 +1136,7 @@ class TableElement:
 
         Returns:
             None: This method does not return anything. If the input is not a DataFrame,
-            prints a message and returns None.
+            logs a warning and returns None.
 
         Notes:
             If `self.table` is None, it initializes it as an empty dictionary before
@@ -921,7 +1144,7 @@ class TableElement:
         """
 
         if not isinstance(table, pd.DataFrame):
-            print("Table is not a pandas DataFrame.")
+            logger.warning("Table is not a pandas DataFrame.")
             return None
         if self.table is None:
             self.table = {}
@@ -936,7 +1159,7 @@ class TableElement:
         sheet is a pandas DataFrame,
         it is converted to a dictionary using the DataFrame's `to_dict()` method.
         If the value is not a DataFrame,
-        a message is printed indicating the sheet is not a DataFrame.
+        a warning is logged indicating the sheet is not a DataFrame.
 
         Returns:
             None
@@ -945,11 +1168,11 @@ class TableElement:
             This method modifies `self.table` in place, replacing DataFrame objects
             with their dictionary representations.
         """
-        for sheet in self.table.keys():
-            if isinstance(self.table[sheet], pd.DataFrame):
-                self.table[sheet] = self.table[sheet].to_dict()
+        for sheet, content in self.table.items():
+            if isinstance(content, pd.DataFrame):
+                self.table[sheet] = content.to_dict()
             else:
-                print(f"Sheet {sheet} is not a pandas DataFrame.")
+                logger.warning("Sheet %s is not a pandas DataFrame.", sheet)
 
     def convert_pd_to_export(self, header=True):
         """
@@ -987,39 +1210,31 @@ class TableElement:
         Notes:
             Any exceptions during conversion are caught and handled internally.
         """
-        if not all(
-            isinstance(element, pd.DataFrame) for element in self.table.values()
-        ):
+        sheets = list(self.table.items())
+        if not all(isinstance(df, pd.DataFrame) for _, df in sheets):
             try:
                 self.table_to_pd()
             except (TypeError, ValueError, KeyError, AttributeError) as e:
-                print(f"Table could not be converted to pandas DataFrame: {e}")
+                logger.warning(
+                    "Table could not be converted to pandas DataFrame: %s", e
+                )
                 return None
-        tmp_table = deepcopy(self.table)
+            sheets = list(self.table.items())
         table_content = {"sheets": {}}
-        for sheet in tmp_table.keys():
+        for sheet, df in sheets:
+            values = _to_export_values(df)
             if header:
-                tmp_table[sheet].index = tmp_table[sheet].index + 1
-                tmp_table[sheet].loc[0] = tmp_table[sheet].columns
-            tmp_table[sheet].sort_index(inplace=True)
-            tmp_table[sheet].reset_index(drop=True, inplace=True)
-            row_count = tmp_table[sheet].shape[0]
-            column_count = tmp_table[sheet].shape[1]
-            tmp_table[sheet].columns = range(tmp_table[sheet].shape[1])
-            tmp_table[sheet].replace(
-                {np.nan: None, np.inf: None, -np.inf: None}, inplace=True
-            )
-            tmp_table[sheet] = tmp_table[sheet].to_dict(orient="index")
-            for row in tmp_table[sheet].keys():
-                for col in tmp_table[sheet][row].keys():
-                    tmp_table[sheet][row][col] = {"value": tmp_table[sheet][row][col]}
+                labels = _mask_missing(df.columns.to_numpy(dtype=object))
+                values = np.vstack([labels[np.newaxis, :], values])
+            row_count, column_count = values.shape
+            data_table = _array_to_data_table(values)
             table_content["sheets"].update(
                 {
                     sheet: {
                         "name": sheet,
                         "rowCount": row_count,
                         "columnCount": column_count,
-                        "data": {"dataTable": tmp_table[sheet]},
+                        "data": {"dataTable": data_table},
                     }
                 }
             )
@@ -1040,19 +1255,16 @@ class TableElement:
 
         Notes:
             Only dictionary entries in the table are converted to DataFrames.
-            Non-dictionary entries are left unchanged and a message is printed for
+            Non-dictionary entries are left unchanged and a warning is logged for
             each such entry.
         """
-        if in_place:
-            table = self.table
-        else:
-            table = deepcopy(self.table)
-
-        for sheet in table.keys():
-            if isinstance(table[sheet], dict):
-                table[sheet] = pd.DataFrame(table[sheet])
+        table = self.table if in_place else {}
+        for sheet, content in self.table.items():
+            if isinstance(content, dict):
+                content = pd.DataFrame(content)
             else:
-                print(f"Sheet {sheet} is not a dictionary.")
+                logger.warning("Sheet %s is not a dictionary.", sheet)
+            table[sheet] = content
         if not in_place:
             return table
         return None
@@ -1062,7 +1274,8 @@ class TableElement:
 
         Args:
             in_place (bool, optional): If True, modifies the internal `table` attribute in place.
-            If False, operates on a deep copy and returns the converted dictionary.
+            If False, builds a new sheet mapping and returns the converted
+            dictionary.
             Default is True.
 
         Returns:
@@ -1073,23 +1286,56 @@ class TableElement:
             - Each sheet in the table that is a pandas DataFrame is converted to a
               dictionary using `to_dict()`.
             - Sheets that are already dictionaries are left unchanged.
-            - If a sheet is neither a DataFrame nor a dictionary, a message is printed.
+            - If a sheet is neither a DataFrame nor a dictionary, a warning is logged.
         """
-        if in_place:
-            table = self.table
-        else:
-            table = deepcopy(self.table)
-        for sheet in table.keys():
-            if isinstance(table[sheet], pd.DataFrame):
-                table[sheet] = table[sheet].to_dict()
-            elif isinstance(table[sheet], dict):
-                pass
-            else:
-                print(f"Sheet {sheet} is not a pandas DataFrame or dictionary.")
+        table = self.table if in_place else {}
+        for sheet, content in self.table.items():
+            if isinstance(content, pd.DataFrame):
+                content = content.to_dict()
+            elif not isinstance(content, dict):
+                logger.warning(
+                    "Sheet %s is not a pandas DataFrame or dictionary.", sheet
+                )
+            table[sheet] = content
         if not in_place:
             return table
         return None
 
+    def clone(self, deep=True):
+        """Create a copy of the table element.
+
+        Args:
+            deep (bool, optional): If True, the DataFrames are copied so that the
+                clone can be modified independently. If False, the clone shares the
+                underlying data with this table, which is cheaper when the copy is
+                only read (default is True).
+
+        Returns:
+            TableElement: A new TableElement with the same metadata and sheets.
+
+        Notes:
+            DataFrame sheets are copied with `DataFrame.copy`, which copies the
+            underlying arrays without walking every cell. Sheets that are still in
+            the raw Labfolder format are deep-copied.
+        """
+        table = None
+        if self.table is not None:
+            table = {
+                sheet: (
+                    content.copy(deep=deep)
+                    if isinstance(content, pd.DataFrame)
+                    else deepcopy(content)
+                )
+                for sheet, content in self.table.items()
+            }
+        clone = TableElement(
+            None, element_id=self.element_id, entry_id=self.entry_id, table=table
+        )
+        clone.creation_date = self.creation_date
+        clone.owner_id = self.owner_id
+        clone.title = self.title
+        return clone
+
     def __repr__(self):
         """Return a string representation of the TableElement instance.
 
@@ -1102,6 +1348,92 @@ class TableElement:
         )
 
 
+def _data_table_to_array(data_table: dict) -> np.ndarray:
+    """Read a Labfolder dataTable into a dense object array.
+
+    Args:
+        data_table (dict): The nested dictionary of a sheet, mapping row indices
+            to dictionaries that map column indices to cells with a 'value' key.
+
+    Returns:
+        numpy.ndarray: A two-dimensional object array in which every cell is
+        placed by its row and column index. Missing cells are `numpy.nan`.
+    """
+    n_rows = max((int(row) for row in data_table), default=-1) + 1
+    n_cols = (
+        max((int(col) for cells in data_table.values() for col in cells), default=-1)
+        + 1
+    )
+    # Cells are assigned one by one so that a value holding a sequence is stored
+    # as a single object instead of being unpacked into an extra dimension.
+    values = np.empty((n_rows, n_cols), dtype=object)
+    values.fill(np.nan)
+    for row, cells in data_table.items():
+        row = int(row)
+        for col, cell in cells.items():
+            values[row, int(col)] = cell.get("value", np.nan)
+    return values
+
+
+def _array_to_data_table(values: np.ndarray) -> dict:
+    """Write a two-dimensional array into the Labfolder dataTable format.
+
+    Args:
+        values (numpy.ndarray): The cell values, one row per table row.
+
+    Returns:
+        dict: A nested dictionary mapping row indices to dictionaries that map
+        column indices to cells of the form {'value': value}.
+    """
+    return {
+        row: {col: {"value": value} for col, value in enumerate(cells)}
+        for row, cells in enumerate(values.tolist())
+    }
+
+
+def _to_export_values(df: pd.DataFrame) -> np.ndarray:
+    """Convert a DataFrame to an object array with missing values set to None.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame to convert.
+
+    Returns:
+        numpy.ndarray: An object array of the DataFrame's values in which NaN,
+        missing, and infinite values are replaced by None.
+
+    Notes:
+        Float columns are masked with a single `numpy.isfinite` pass. Other
+        columns are masked with `pandas.isna` and compared against infinity once,
+        since they may still hold float values.
+    """
+    values = np.empty(df.shape, dtype=object)
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "fc":
+            column = column.to_numpy()
+            values[:, i] = np.where(np.isfinite(column), column, None)
+        else:
+            values[:, i] = _mask_missing(column.to_numpy(dtype=object))
+    return values
+
+
+def _mask_missing(values: np.ndarray) -> np.ndarray:
+    """Return a copy of an object array with missing and infinite values set to None.
+
+    Args:
+        values (numpy.ndarray): A one-dimensional object array. It may be a view of
+            a DataFrame's data or of an Index and is never modified.
+
+    Returns:
+        numpy.ndarray: A new array, with NaN, missing, and infinite values
+        replaced by None.
+    """
+    values = values.copy()
+    values[pd.isna(values)] = None
+    values[(values == np.inf) | (values == -np.inf)] = None
+    return values
+
+
 def _handle_response(
     element,
     response: requests.Response,
@@ -1111,38 +1443,119 @@ def _handle_response(
     """Handle the response from Labfolder API requests.
 
     Args:
-        response (int): The HTTP status code from the response.
-        element_name (str): The name of the element being processed.
-        silent (bool): If True, suppresses print statements.
+        element: The element the request was made for; its `type` is used in the
+            message.
+        response (requests.Response): The response of the POST or PUT request.
+        silent (bool): If True, nothing is logged.
+        return_status (bool): If True, returns whether the request succeeded.
+
     Returns:
-        None
+        bool | None: True if a PUT returned 200 or a POST returned 201, False
+        otherwise, if `return_status` is True. None otherwise.
     """
-    response_text = ""
-    if response == 200 and response.request.method == "PUT":
-        response_text = element.type, "updated on Labfolder."
+    status_code = response.status_code
+    method = response.request.method
+    if method == "PUT" and status_code == 200:
+        if not silent:
+            logger.info("%s updated on Labfolder.", element.type)
         status = True
-    elif response == 201 and response.request.method == "POST":
-        response_text = element.type, "written to Labfolder."
+    elif method == "POST" and status_code == 201:
+        if not silent:
+            logger.info("%s written to Labfolder.", element.type)
         status = True
     else:
-        if response.request.method == "POST":
-            response_text = (
-                f"{element.type} could not be written to Labfolder. "
-                f"Status code: {response.status_code}"
-            )
-        elif response.request.method == "PUT":
-            response_text = (
-                f"{element.type} could not be updated on Labfolder. "
-                f"Status code: {response.status_code}"
+        if not silent:
+            logger.warning(
+                "%s could not be %s Labfolder. Status code: %s",
+                element.type,
+                "written to" if method == "POST" else "updated on",
+                status_code,
             )
         status = False
-    if not silent:
-        print(response_text)
     if return_status:
         return status
     return None
 
 
+def _load_element(element, user_info: LabFolderUserInfo) -> None:
+    """Load an element from Labfolder using the loader matching its type.
+
+    Args:
+        element: The element to load, e.g. a DataElement or TextElement.
+        user_info (LabFolderUserInfo): An object containing the user's Labfolder
+            API address and authentication token.
+
+    Returns:
+        None
+    """
+    loader = _ELEMENT_LOADERS.get(element.type)
+    if loader is None:
+        logger.warning("Skipping %s element, it has no loader.", element.type)
+        return None
+    getattr(element, loader)(user_info)
+    return None
+
+
+def _build_file(element: dict, user_info: LabFolderUserInfo) -> FileElement:
+    """Build a FileElement from an element of an entry."""
+    return FileElement(element_id=element.get("id", ""))
+
+
+def _build_image(element: dict, user_info: LabFolderUserInfo) -> ImageElement:
+    """Build a ImageElement from an element of an entry."""
+    return ImageElement(
+        element_id=element.get("id", ""),
+        title=element.get("title", ""),
+        original_file_content_type=element.get(
+            "original_file_content_type", "image/png"
+        ),
+    )
+
+
+def _build_text(element: dict, user_info: LabFolderUserInfo) -> TextElement:
+    """Build a TextElement from an element of an entry."""
+    return TextElement(
+        element_id=element.get("id", ""), content=element.get("content", "")
+    )
+
+
+def _build_descriptive_data(
+    element: dict, user_info: LabFolderUserInfo
+) -> DescriptiveDataElement:
+    """Build a DescriptiveDataElement from an element of an entry."""
+    return DescriptiveDataElement(
+        element_id=element.get("id", ""),
+        title=element.get("title", ""),
+        description=element.get("description", ""),
+    )
+
+
+def _build_data(element: dict, user_info: LabFolderUserInfo) -> DataElement:
+    """Build a DataElement from an element of an entry."""
+    return DataElement(
+        element_id=element.get("id", ""), description=element.get("description", "")
+    )
+
+
+def _build_table(element: dict, user_info: LabFolderUserInfo) -> TableElement:
+    """Build a TableElement from an element of an entry."""
+    return TableElement(
+        user_info=user_info,
+        element_id=element.get("id", ""),
+        entry_id=element.get("entry_id", ""),
+    )
+
+
+_ELEMENT_BUILDERS = {
+    "FILE": _build_file,
+    "IMAGE": _build_image,
+    "TEXT": _build_text,
+    "DESCRIPTIVE_DATA": _build_descriptive_data,
+    "DATA": _build_data,
+    "TABLE": _build_table,
+}
+
+
 def parse_data_element(
     element: dict, user_info: LabFolderUserInfo
 ) -> (
@@ -1167,7 +1580,6 @@ def parse_data_element(
         DataElementGroup | FileElement | ImageElement | TextElement |
         DescriptiveDataElement | DataElement | TableElement | None
     """
-    return_element = None
     t = element.get("element_type", "")
     if t == "DATA_ELEMENT_GROUP":
         group = DataElementGroup(title=element.get("title", ""))
@@ -1176,36 +1588,8 @@ def parse_data_element(
             if c is not None:
                 group.add_child(c)
         return group
-    if t == "FILE":
-        return_element = FileElement(element_id=element.get("id", ""))
-    if t == "IMAGE":
-        return_element = ImageElement(
-            element_id=element.get("id", ""),
-            title=element.get("title", ""),
-            original_file_content_type=element.get(
-                "original_file_content_type", "image/png"
-            ),
-        )
-    if t == "TEXT":
-        return_element = TextElement(
-            element_id=element.get("id", ""), content=element.get("content", "")
-        )
-    if t == "DESCRIPTIVE_DATA":
-        return_element = DescriptiveDataElement(
-            element_id=element.get("id", ""),
-            title=element.get("title", ""),
-            description=element.get("description", ""),
-        )
-    if t == "DATA":
-        return_element = DataElement(
-            element_id=element.get("id", ""), description=element.get("description", "")
-        )
-    if t == "TABLE":
-        return_element = TableElement(
-            user_info=user_info,
-            element_id=element.get("id", ""),
-            entry_id=element.get("entry_id", ""),
-        )
-    if return_element is None:
-        print(f"Unknown element type: {element}")
-    return return_element
+    builder = _ELEMENT_BUILDERS.get(t)
+    if builder is None:
+        logger.warning("Unknown element type: %s", element)
+        return None
+    return builder(element, user_info)
@@ -11,17 +11,35 @@ Classes:
 Functions:
     _get_entry(entry: Entry, entry_id: str, user_info: LabFolderUserInfo) -> list:
         Retrieves the details of a LabFolder entry, including its elements, based on the entry ID.
+    _get_element(element: dict, api: str, session, timeout) -> dict | None:
+        Retrieves the details of a single element of an entry.
 
 Dependencies:
     requests: Used for making HTTP requests to the LabFolder API.
+    orjson (optional): Used for parsing the API responses if it is installed.
     LabFolderUserInfo: Represents user authentication and API access information.
     parse_data_element: Parses individual data elements of an entry.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from labfolder.classes.labfolder_access import LabFolderUserInfo
+from labfolder.classes.labfolder_access import LabFolderUserInfo, _json_loads
 from labfolder.classes.data_elements import parse_data_element
 
+logger = logging.getLogger(__name__)
+
+_ELEMENT_PATHS = {
+    "FILE": "elements/file/",
+    "IMAGE": "elements/image/",
+    "TEXT": "elements/text/",
+    "TABLE": "elements/table/",
+    "DATA_ELEMENT_GROUP": "elements/data/",
+    "DATA": "elements/data/",
+    "WELL_PLATE": "elements/well-plate/",
+}
+
 
 class Entry:
     """Represents a LabFolder entry.
@@ -41,6 +59,16 @@ class Entry:
         elements (list): A list of elements associated with the entry.
     """
 
+    __slots__ = (
+        "entry_id",
+        "title",
+        "author_id",
+        "project_id",
+        "tags",
+        "creation_date",
+        "elements",
+    )
+
     def __init__(self, user_info: LabFolderUserInfo, entry_id="", raw=False):
         """Initializes an instance of the Entry class.
 
@@ -59,6 +87,35 @@ class Entry:
         if entry_id != "":
             self.get_entry(raw=raw, user_info=user_info)
 
+    @classmethod
+    def bulk(
+        cls, user_info: LabFolderUserInfo, entry_ids, raw=False, max_workers=8
+    ) -> list:
+        """Retrieves several entries concurrently.
+
+        Args:
+            user_info (LabFolderUserInfo): User authentication and API access information.
+            entry_ids (Iterable[str]): The unique identifiers of the entries to retrieve.
+            raw (bool, optional): If True, keeps the raw elements of the entries.
+                Defaults to False.
+            max_workers (int, optional): The number of entries retrieved at the same
+                time. Defaults to 8.
+
+        Returns:
+            list: The retrieved entries, in the order of `entry_ids`.
+
+        Notes:
+            Each entry still requests its elements concurrently, so the number of
+            simultaneous requests can exceed `max_workers`.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda entry_id: cls(user_info, entry_id=entry_id, raw=raw),
+                    entry_ids,
+                )
+            )
+
     def get_entry(self, user_info: LabFolderUserInfo, raw=False):
         """Retrieves and processes the elements of an entry using the provided user information.
 
@@ -106,15 +163,20 @@ class Entry:
             tags (str or list): A single tag as a string, or a list of tags to add.
 
         Notes:
-            Ensures that tags are unique after addition.
+            Tags that are already present are skipped, so tags stay unique and keep
+            the order in which they were added.
             If a list is provided, all elements are added. If a string is provided,
             it is added as a single tag.
         """
-        if isinstance(tags, list):
-            self.tags.extend(tags)
         if isinstance(tags, str):
-            self.tags.append(tags)
-        self.tags = list(set(self.tags))
+            tags = [tags]
+        elif not isinstance(tags, list):
+            return
+        seen = set(self.tags)
+        for tag in tags:
+            if tag not in seen:
+                seen.add(tag)
+                self.tags.append(tag)
 
     def add_creation_date(self, creation_date):
         """Adds a creation date to the entry.
@@ -152,7 +214,7 @@ class Entry:
             Sends a POST request to the LabFolder API to create a new entry with the
             current object's attributes.
             If successful, sets self.entry_id to the ID of the newly created entry.
-            Prints an error message if the entry creation fails.
+            Logs a warning if the entry creation fails.
 
         Raises:
             requests.RequestException: If the HTTP request fails due to network issues or timeouts.
@@ -166,14 +228,13 @@ class Entry:
             "elements": self.elements,
             #     "locked": False
         }
-        response = requests.post(
-            endpoint, headers=user_info.auth_token, json=entry, timeout=10
+        response = user_info.session.post(
+            endpoint, json=entry, timeout=user_info.timeout
         )
         if response.status_code == 201:
-            response_json = response.json()
-            self.entry_id = response_json["id"]
+            self.entry_id = _json_loads(response.content)["id"]
         else:
-            print(f"Error creating entry: {response.status_code}")
+            logger.warning("Error creating entry: %s", response.status_code)
 
     def update_entry(self, user_info: LabFolderUserInfo) -> None:
         """
@@ -188,13 +249,13 @@ class Entry:
             None
 
         Notes:
-            If the entry_id is not set (empty string), the function prints a warning
+            If the entry_id is not set (empty string), the function logs a warning
             and returns without making a request. The entry is updated with the current
             values of title, author_id, project_id, tags, and elements. The 'locked'
             field is always set to False during the update.
         """
         if self.entry_id == "":
-            print("Entry ID not set.")
+            logger.warning("Entry ID not set.")
             return None
         endpoint = f"{user_info.api_address}entries/{self.entry_id}"
         entry = {
@@ -205,13 +266,13 @@ class Entry:
             "elements": self.elements,
             "locked": False,
         }
-        response = requests.put(
-            endpoint, headers=user_info.auth_token, json=entry, timeout=10
+        response = user_info.session.put(
+            endpoint, json=entry, timeout=user_info.timeout
         )
         if response.status_code != 200:
-            print(f"Error updating entry: {response.status_code}")
+            logger.warning("Error updating entry: %s", response.status_code)
         else:
-            print("Entry updated successfully.")
+            logger.info("Entry updated successfully.")
         return None
 
 
@@ -231,75 +292,53 @@ def _get_entry(entry: Entry, entry_id: str, user_info: LabFolderUserInfo) -> lis
 
     Notes:
         Supports element types: FILE, IMAGE, TEXT, TABLE, DATA_ELEMENT_GROUP,
-        DATA, WELL_PLATE. Prints a message for unsupported element types.
+        DATA, WELL_PLATE. Logs a warning for unsupported element types.
         Populates the provided Entry object with metadata fields such as
         author_id, creation_date, tags, project_id, and title.
+        The elements are requested concurrently over the pooled session of
+        `user_info`; their order in the entry is preserved.
     """
-    endpoint = f"{user_info.api_address}entries/{entry_id}"
-    entry_dict = requests.get(endpoint, headers=user_info.auth_token, timeout=10).json()
+    api = user_info.api_address
+    session = user_info.session
+    timeout = user_info.timeout
+    entry_dict = _json_loads(
+        session.get(f"{api}entries/{entry_id}", timeout=timeout).content
+    )
     entry.author_id = entry_dict["author_id"]
     entry.creation_date = entry_dict["creation_date"]
     entry.tags = entry_dict["tags"]
     entry.project_id = entry_dict["project_id"]
     entry.title = entry_dict["title"]
-    elements = []
-    for element in entry_dict["elements"]:
-        if element["type"] == "FILE":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/file/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        elif element["type"] == "IMAGE":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/image/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        elif element["type"] == "TEXT":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/text/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        elements = list(
+            executor.map(
+                lambda element: _get_element(element, api, session, timeout),
+                entry_dict["elements"],
             )
-        elif element["type"] == "TABLE":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/table/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        elif element["type"] == "DATA_ELEMENT_GROUP":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/data/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        elif element["type"] == "DATA":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/data/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        elif element["type"] == "WELL_PLATE":
-            elements.append(
-                requests.get(
-                    user_info.api_address + f"elements/well-plate/{element['id']}",
-                    headers=user_info.auth_token,
-                    timeout=10,
-                ).json()
-            )
-        else:
-            print(f"Element type {element['type']} not supported.")
-    return elements
+        )
+    return [element for element in elements if element is not None]
+
+
+def _get_element(
+    element: dict, api: str, session: requests.Session, timeout
+) -> dict | None:
+    """
+    Fetches the details of a single element of an entry from the LabFolder API.
+
+    Args:
+        element (dict): The element reference from the entry, containing its
+            type and ID.
+        api (str): The API address of the LabFolder instance.
+        session (requests.Session): The pooled session carrying the authentication
+            headers.
+        timeout (tuple): The (connect, read) timeout in seconds.
+
+    Returns:
+        dict | None: The element details, or None if the element type is not supported.
+    """
+    path = _ELEMENT_PATHS.get(element["type"])
+    if path is None:
+        logger.warning("Element type %s not supported.", element["type"])
+        return None
+    response = session.get(f"{api}{path}{element['id']}", timeout=timeout)
+    return _json_loads(response.content)
@@ -4,11 +4,50 @@ It includes methods for user authentication, data retrieval, and other
 operations related to Labfolder.
 """
 
+import atexit
 import getpass
 import json
+import logging
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from labfolder import __version__
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_CACHE_SIZE = 1024
+_CONNECT_TIMEOUT = 2.0
+_READ_TIMEOUT = 10.0
+_LOGOUT_TIMEOUT = (1.0, 2.0)
+_INITIALS_RE = re.compile(r"[^A-Z]")
+_USER_INFO_TTL = 300
+
+# Responses of /me by (labfolder_url, Authorization header), with the time
+# they were retrieved.
+_USER_INFO_CACHE = {}
+_USER_INFO_LOCK = threading.Lock()
+
+_LOGIN_MESSAGES = {
+    400: "Incorrect input. Login failed.",
+    401: "Username or password incorrect. Login failed.",
+    403: "Blocked login. Login failed.",
+}
+
+_TOKEN_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "labfolderpy", "tokens.json"
+)
 
 
 class LabFolderUserInfo:
@@ -18,6 +57,13 @@ class LabFolderUserInfo:
     Args:
         auth_token (dict, optional): Authentication token for Labfolder API.
         labfolder_url (str, optional): Base URL for the Labfolder instance.
+        session (requests.Session, optional): Session to reuse, e.g. the one the
+            login request was sent with. A new session is created if not given.
+        timeout (tuple, optional): The (connect, read) timeout in seconds of the
+            requests made by this class. Defaults to (2.0, 10.0).
+        pool_size (int, optional): The number of pooled connections of a newly
+            created session, i.e. how many requests can run concurrently. Defaults
+            to the number of CPUs, but at least 32.
 
     Attributes:
         auth_token (dict): Authentication token for accessing Labfolder API.
@@ -28,37 +74,320 @@ class LabFolderUserInfo:
         email (str): Email address of the user.
         user_id (int): Unique identifier of the user.
         location (str): User's time zone/location.
+        url_data (str): Endpoint of the data elements.
+        url_text (str): Endpoint of the text elements.
+        url_table (str): Endpoint of the table elements.
+        url_image (str): Endpoint of the image elements.
+        session (requests.Session): Pooled HTTP session carrying the
+            authentication headers, reused for all API calls.
+        timeout (tuple): The (connect, read) timeout in seconds.
 
     Methods:
         _get_user_info(): Retrieves and sets the user information from Labfolder API.
+            The response is reused for five minutes for the same URL and token.
+            Raises requests.HTTPError if Labfolder rejects the token.
+        get_json(url): Retrieves JSON from the API, raising on error responses.
+        cached_get(url, ttl): Retrieves JSON from the API, reusing recent responses.
+        invalidate_cache(url): Drops a cached response.
     """
 
-    def __init__(self, auth_token: dict | None = None, labfolder_url: str = "") -> None:
+    __slots__ = (
+        "auth_token",
+        "timeout",
+        "labfolder_url",
+        "api_address",
+        "url_data",
+        "url_text",
+        "url_table",
+        "url_image",
+        "_me_url",
+        "_logout_url",
+        "session",
+        "first_name",
+        "last_name",
+        "initials",
+        "email",
+        "user_id",
+        "location",
+        "_cache",
+        "_cache_lock",
+        "_token_key",
+    )
+
+    def __init__(
+        self,
+        auth_token: dict | None = None,
+        labfolder_url: str = "",
+        session: requests.Session | None = None,
+        timeout: tuple = (_CONNECT_TIMEOUT, _READ_TIMEOUT),
+        pool_size: int | None = None,
+    ) -> None:
         self.auth_token = auth_token
+        self.timeout = timeout
         self.labfolder_url = labfolder_url
-        self.api_address = labfolder_url + "/api/v2/"
+        self.api_address = f"{labfolder_url}/api/v2/"
+        self._me_url = f"{self.api_address}me"
+        self._logout_url = f"{self.api_address}auth/logout"
+        self.url_data = f"{self.api_address}elements/data"
+        self.url_text = f"{self.api_address}elements/text"
+        self.url_table = f"{self.api_address}elements/table"
+        self.url_image = f"{self.api_address}elements/image"
+        self.session = _create_session(pool_size) if session is None else session
+        if auth_token is not None:
+            self.session.headers.update(auth_token)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Key of the token in the disk cache, set by labfolder_login(cache_token=True).
+        self._token_key = None
         if auth_token is not None and len(labfolder_url) > 0:
             self._get_user_info()
         else:
-            print(
-                "No authentication token or Labfolder URL provided. User information not retrieved."
+            logger.info(
+                "No authentication token or Labfolder URL provided. "
+                "User information not retrieved."
             )
 
     def _get_user_info(self):
-        user_data = requests.get(
-            self.api_address + "me",
-            params={"expand": "user"},
-            headers=self.auth_token,
-            timeout=5,
-        ).json()
+        key = (self.labfolder_url, self.auth_token.get("Authorization"))
+        now = time.monotonic()
+        with _USER_INFO_LOCK:
+            cached = _USER_INFO_CACHE.get(key)
+        if cached is not None and now - cached[0] < _USER_INFO_TTL:
+            user_data = cached[1]
+        else:
+            response = self.session.get(
+                self._me_url,
+                params={"expand": "user"},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            user_data = _json_loads(response.content)
+            with _USER_INFO_LOCK:
+                _USER_INFO_CACHE[key] = (now, user_data)
         self.first_name = user_data["user"]["first_name"]
         self.last_name = user_data["user"]["last_name"]
-        self.initials = re.sub(r"[^A-Z]", "", self.first_name) + re.sub(
-            r"[^A-Z]", "", self.last_name
-        )
+        self.initials = _INITIALS_RE.sub("", self.first_name + self.last_name)
         self.email = user_data["user"]["email"]
         self.user_id = user_data["user"]["id"]
-        self.location = user_data["user_settings"]["zone_id"]
+        self.location = user_data.get("user_settings", {}).get("zone_id", "")
+
+    def get_json(self, url: str):
+        """
+        Retrieves the JSON response of a GET request.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            dict: The parsed JSON response.
+
+        Raises:
+            requests.HTTPError: If the response has an error status code. The body
+                of error responses is not parsed.
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def cached_get(self, url: str, ttl: float = 60):
+        """
+        Retrieves the JSON response of a GET request, reusing a cached response
+        for the same URL if it is younger than `ttl` seconds.
+
+        Args:
+            url (str): The URL to request.
+            ttl (float, optional): The maximum age of a cached response in seconds.
+                Defaults to 60.
+
+        Returns:
+            dict: The parsed JSON response.
+
+        Raises:
+            requests.HTTPError: If the response has an error status code.
+
+        Notes:
+            - Only successful responses are cached. The cache holds at most 1024
+              responses and evicts the least recently used one first.
+            - The returned object is shared with the cache and should not be
+              modified in place.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(url)
+            if cached is not None and now - cached[0] < ttl:
+                self._cache.move_to_end(url)
+                return cached[1]
+        data = self.get_json(url)
+        with self._cache_lock:
+            self._cache[url] = (now, data)
+            self._cache.move_to_end(url)
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return data
+
+    def invalidate_cache(self, url: str) -> None:
+        """
+        Drops the cached response for a URL, e.g. after the element was changed.
+
+        Args:
+            url (str): The URL whose cached response should be dropped.
+        """
+        with self._cache_lock:
+            self._cache.pop(url, None)
+
+
+def _create_session(pool_size: int | None = None) -> requests.Session:
+    """
+    Creates an HTTP session with a connection pool and retries for transient
+    server errors.
+
+    Args:
+        pool_size (int, optional): The number of connections kept open to the
+            Labfolder host. Defaults to the number of CPUs, but at least 32.
+
+    Returns:
+        requests.Session: The new session.
+
+    Notes:
+        - Failed requests are retried up to three times with exponential backoff,
+          honouring a Retry-After header sent by the server. Failed connections
+          are not retried, so an unreachable host fails after the connect
+          timeout.
+        - Only idempotent methods are retried. POST requests are not, since a
+          repeated POST can create an element twice.
+        - Once the retries are used up, the last response is returned so that
+          callers can handle its status code.
+        - Requests identify themselves as LabfolderPy and ask for JSON. Requests
+          for binary content, such as image data, override the Accept header.
+        - Threads wait for a free connection when all `pool_size` connections are
+          in use, instead of opening connections that are discarded afterwards.
+    """
+    if pool_size is None:
+        pool_size = max(32, os.cpu_count() or 4)
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_size,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.headers.update(
+        {"User-Agent": f"LabfolderPy/{__version__}", "Accept": "application/json"}
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _json_loads(content: bytes):
+    """
+    Parses a JSON response body, using orjson if it is installed.
+
+    Args:
+        content (bytes): The raw response body.
+
+    Returns:
+        Any: The parsed JSON content.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj) -> bytes:
+    """
+    Serializes a request body to JSON, using orjson if it is installed.
+
+    Args:
+        obj (Any): The object to serialize. Dictionary keys may be integers, as in
+            exported table content.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(obj).encode("utf-8")
+
+
+def _read_token_cache() -> dict:
+    """
+    Reads the cached bearer tokens from disk.
+
+    Returns:
+        dict: The cached tokens by "<labfolder_url> <user>", or an empty dictionary
+        if there is no readable cache.
+    """
+    try:
+        with open(_TOKEN_CACHE_PATH, "rb") as file:
+            return _json_loads(file.read())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_token_cache(tokens: dict) -> None:
+    """
+    Writes the bearer tokens to disk, readable only by the current user.
+
+    Args:
+        tokens (dict): The tokens by "<labfolder_url> <user>".
+    """
+    os.makedirs(os.path.dirname(_TOKEN_CACHE_PATH), mode=0o700, exist_ok=True)
+    fd = os.open(_TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(_json_dumps(tokens))
+
+
+def _login_with_cached_token(
+    labfolder_url: str, user: str, timeout: tuple, pool_size: int | None
+):
+    """
+    Logs in with a cached bearer token if it is still accepted by Labfolder.
+
+    Args:
+        labfolder_url (str): The base URL of the Labfolder instance.
+        user (str): The user's email address.
+        timeout (tuple): The (connect, read) timeout in seconds.
+        pool_size (int | None): The connection pool size of the session.
+
+    Returns:
+        LabFolderUserInfo | None: The user information, or None if no token is
+        cached or the cached token was rejected.
+    """
+    token_key = f"{labfolder_url} {user}"
+    token = _read_token_cache().get(token_key)
+    if token is None:
+        return None
+    auth_token = {"Authorization": f"Bearer {token}"}
+    session = _create_session(pool_size)
+    response = session.get(
+        f"{labfolder_url}/api/v2/me",
+        params={"expand": "user"},
+        headers=auth_token,
+        timeout=timeout,
+    )
+    if response.status_code != 200:
+        session.close()
+        return None
+    with _USER_INFO_LOCK:
+        _USER_INFO_CACHE[(labfolder_url, auth_token["Authorization"])] = (
+            time.monotonic(),
+            _json_loads(response.content),
+        )
+    user_auth = LabFolderUserInfo(
+        auth_token, labfolder_url, session=session, timeout=timeout
+    )
+    user_auth._token_key = token_key
+    return user_auth
 
 
 def labfolder_login(
@@ -66,7 +395,13 @@ def labfolder_login(
     user: str = "",
     password: str = "",
     allow_input: bool = True,
-) -> LabFolderUserInfo:
+    cache_token: bool = False,
+    force_refresh: bool = False,
+    connect_timeout: float = _CONNECT_TIMEOUT,
+    read_timeout: float = _READ_TIMEOUT,
+    pool_size: int | None = None,
+    logout_at_exit: bool = False,
+) -> LabFolderUserInfo | None:
     """
     Logs into the Labfolder API and returns user information.
 
@@ -76,12 +411,29 @@ def labfolder_login(
         function will prompt for it. Defaults to ''.
         password (str, optional): The user's password. If not provided, the
         function will prompt for it. Defaults to ''.
+        cache_token (bool, optional): If True, the bearer token is stored in
+        ~/.cache/labfolderpy/tokens.json and reused by later logins of the same
+        user for as long as Labfolder accepts it. Defaults to False.
+        force_refresh (bool, optional): If True, a cached token is ignored and
+        replaced by a new login. Defaults to False.
+        connect_timeout (float, optional): Seconds to wait for a connection to the
+        server, so that an unreachable host fails fast. Defaults to 2.0.
+        read_timeout (float, optional): Seconds to wait for a response once
+        connected. Defaults to 10.0. Both timeouts are kept by the returned
+        LabFolderUserInfo and used by the element and entry requests made with
+        it, except for table and image uploads, which allow 30 seconds.
+        pool_size (int, optional): The number of pooled connections of the
+        session, i.e. how many requests can run concurrently. Defaults to the
+        number of CPUs, but at least 32.
+        logout_at_exit (bool, optional): If True, the user is logged out when the
+        interpreter exits, unless `labfolder_logout` was called before.
+        Defaults to False.
 
     Returns:
         LabFolderUserInfo: An instance of LabFolderUserInfo containing the authentication token
         and user details if login is successful.
-        None: If login fails due to incorrect credentials, incorrect input, or
-        blocked login.
+        None: If login fails due to incorrect credentials, incorrect input,
+        blocked login, or any other error status.
 
     Raises:
         requests.exceptions.RequestException: If there is an issue with the
@@ -92,62 +444,102 @@ def labfolder_login(
           are not provided as arguments.
         - The function handles HTTP status codes 200, 400, 401, and 403
           specifically.
+        - A cached token is checked before the password is asked for, so no
+          password is needed while the token is valid. The cache file is only
+          readable by the current user, but holds the token in plain text.
     """
-    if allow_input:
-        if user == "":
-            user = input("user email: ")
-        if password == "":
-            password = getpass.getpass("Password for " + user + ": ")
+    timeout = (connect_timeout, read_timeout)
+    if allow_input and user == "":
+        user = input("user email: ")
+    if cache_token and not force_refresh:
+        user_auth = _login_with_cached_token(labfolder_url, user, timeout, pool_size)
+        if user_auth is not None:
+            logger.info("Hello %s!", user_auth.first_name)
+            if logout_at_exit:
+                atexit.register(labfolder_logout, user_auth)
+            return user_auth
+    if allow_input and password == "":
+        password = getpass.getpass(f"Password for {user}: ")
 
-    api_url = labfolder_url + "/api/v2/auth/login"
+    api_url = f"{labfolder_url}/api/v2/auth/login"
 
-    payload = json.dumps({"user": user, "password": password})
-    headers = {"Content-Type": "application/json"}
-    response = requests.request(
-        "POST", api_url, headers=headers, data=payload, timeout=5
+    session = _create_session(pool_size)
+    response = session.post(
+        api_url, json={"user": user, "password": password}, timeout=timeout
     )
-    if response.status_code == 401:
-        print(
-            "Username or password incorrect.\nLogin failed. Status code: "
-            + str(response.status_code)
-        )
-        user_auth = LabFolderUserInfo()
-    elif response.status_code == 400:
-        print(
-            "Incorrect input.\nLogin failed. Status code: " + str(response.status_code)
+    if response.status_code != 200:
+        session.close()
+        logger.warning(
+            "%s Status code: %s",
+            _LOGIN_MESSAGES.get(response.status_code, "Login failed."),
+            response.status_code,
         )
-        user_auth = LabFolderUserInfo()
-    elif response.status_code == 403:
-        print("Blocked login.\nLogin failed. Status code: " + str(response.status_code))
-        user_auth = LabFolderUserInfo()
-    elif response.status_code == 200:
-        auth_token = {"Authorization": "Bearer " + response.json()["token"]}
-        user_auth = LabFolderUserInfo(auth_token, labfolder_url)
-        print("Hello " + user_auth.first_name + "!")
-    else:
-        print("Login failed. Status code: " + str(response.status_code))
-        user_auth = LabFolderUserInfo()
+        return None
+    token = _json_loads(response.content)["token"]
+    auth_token = {"Authorization": f"Bearer {token}"}
+    user_auth = LabFolderUserInfo(
+        auth_token, labfolder_url, session=session, timeout=timeout
+    )
+    if cache_token:
+        tokens = _read_token_cache()
+        user_auth._token_key = f"{labfolder_url} {user}"
+        tokens[user_auth._token_key] = token
+        _write_token_cache(tokens)
+    logger.info("Hello %s!", user_auth.first_name)
+    if logout_at_exit:
+        atexit.register(labfolder_logout, user_auth)
     return user_auth
 
 
-def labfolder_logout(user: LabFolderUserInfo) -> None:
+def labfolder_logout(user: LabFolderUserInfo | None) -> None:
     """
     Logs out the user from the Labfolder API.
+
     Args:
         user (LabFolderUserInfo): An instance of LabFolderUserInfo containing
         the authentication token and Labfolder URL.
+
     Returns:
-        None: If logout is successful.
-        Prints a message indicating the success or failure of the logout operation.
-    """
+        None: Logs a message indicating the success or failure of the logout
+        operation.
 
-    status = requests.request(
-        "POST",
-        user.labfolder_url + "/api/v2/auth/logout",
-        headers=user.auth_token,
-        timeout=5,
-    )
-    if status.status_code == 204:
-        print("Logout successful")
-    else:
-        print("Logout failed. Status code: " + str(status.status_code))
+    Notes:
+        - Logging out is best effort: network errors are reported instead of
+          raised. The request is sent once, without retries, with a 1 second
+          connect and 2 second read timeout, so a dead connection cannot hold up
+          the caller, e.g. at interpreter shutdown.
+        - A 401 response means the token is no longer valid and counts as a
+          successful logout.
+        - The session of `user` is closed afterwards, its token is dropped and a
+          cached token of the user is removed. Logging out again, or logging out
+          None, does nothing.
+    """
+    if user is None or user.auth_token is None:
+        return None
+    try:
+        # Sent outside the session: its adapter retries connection errors with
+        # backoff, which would stretch a dead connection far beyond the timeout.
+        status_code = requests.post(
+            user._logout_url,
+            headers=user.session.headers,
+            timeout=_LOGOUT_TIMEOUT,
+        ).status_code
+    except requests.RequestException as e:
+        status_code = None
+        logger.warning("Logout failed: %s", e)
+    user.session.close()
+    with _USER_INFO_LOCK:
+        _USER_INFO_CACHE.pop(
+            (user.labfolder_url, user.auth_token.get("Authorization")), None
+        )
+    if user._token_key is not None:
+        tokens = _read_token_cache()
+        if tokens.pop(user._token_key, None):
+            _write_token_cache(tokens)
+        user._token_key = None
+    user.auth_token = None
+    if status_code in (204, 401):
+        logger.info("Logout successful")
+    elif status_code is not None:
+        logger.warning("Logout failed. Status code: %s", status_code)
+    return None
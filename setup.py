@@ -5,12 +5,15 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "requests",
-        "pandas",
-        "numpy",
-        "Pillow",
-        "matplotlib",
+        "requests>=2.31",
+        "urllib3>=2.0",
+        "pandas>=2.0",
+        "numpy>=1.24",
+        "Pillow>=10.0",
+        "matplotlib>=3.7",
+        "orjson>=3.9",
     ],
+    python_requires=">=3.10",
     author="Daniel Parthier",
     author_email="daniel.parthier@gmail.com",
     description="Python API for Labfolder integration",
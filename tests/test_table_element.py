@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+from labfolder.classes import data_elements
+from labfolder.classes.data_elements import TableElement
+from labfolder.classes.labfolder_access import LabFolderUserInfo
+
+
+def test_export_does_not_modify_table():
+    df = pd.DataFrame({"h1": ["x", np.nan, np.inf], "h2": [1.0, np.nan, -np.inf]})
+    before = df.copy()
+    table = TableElement(None, table={"S": df})
+
+    exported = table.convert_pd_to_export()
+
+    assert df.equals(before)
+    data_table = exported["sheets"]["S"]["data"]["dataTable"]
+    assert [data_table[row][0]["value"] for row in range(4)] == ["h1", "x", None, None]
+    assert [data_table[row][1]["value"] for row in range(4)] == ["h2", 1.0, None, None]
+
+
+def test_export_does_not_modify_column_labels():
+    df = pd.DataFrame([[1.0, 2.0]], columns=["a", np.nan])
+    columns = df.columns.copy()
+    table = TableElement(None, table={"S": df})
+
+    exported = table.convert_pd_to_export()
+
+    assert df.columns.equals(columns)
+    assert np.isnan(df.columns[1])
+    header = exported["sheets"]["S"]["data"]["dataTable"][0]
+    assert [header[col]["value"] for col in range(2)] == ["a", None]
+
+
+def test_table_to_pd_keeps_sequence_values_as_cells():
+    data_table = {"0": {"0": {"value": [1, 2]}, "1": {"value": [3, 4]}}}
+    table = TableElement(None, table={"S": {"data": {"dataTable": data_table}}})
+
+    df = table.table_to_pd(header=False, in_place=False)["S"]
+
+    assert df.shape == (1, 2)
+    assert df.iloc[0].tolist() == [[1, 2], [3, 4]]
+
+
+def test_table_to_pd_without_header_keeps_string_column_labels():
+    data_table = {"0": {"0": {"value": 1}, "2": {"value": 3}}}
+    table = TableElement(None, table={"S": {"data": {"dataTable": data_table}}})
+
+    df = table.table_to_pd(header=False, in_place=False)["S"]
+
+    assert df.columns.tolist() == ["0", "2"]
+
+
+def test_export_after_table_is_reassigned():
+    data_table = {"0": {"0": {"value": "h"}}, "1": {"0": {"value": 1.0}}}
+    raw = {"S": {"data": {"dataTable": data_table}}}
+    table = TableElement(None, table=dict(raw))
+    table.convert_pd_to_export()
+
+    table.table = dict(raw)
+    exported = table.convert_pd_to_export()
+
+    assert exported["sheets"]["S"]["data"]["dataTable"] == {
+        0: {0: {"value": "h"}},
+        1: {0: {"value": 1.0}},
+    }
+
+
+def test_load_table_converts_sheets_once(monkeypatch):
+    data_table = {"0": {"0": {"value": "h"}}, "1": {"0": {"value": 1.0}}}
+    response = {
+        "entry_id": "e1",
+        "creation_date": "2024-01-01",
+        "owner_id": "u1",
+        "title": "T",
+        "content": {"sheets": {"S": {"data": {"dataTable": data_table}}}},
+    }
+    monkeypatch.setattr(
+        LabFolderUserInfo, "cached_get", lambda self, url, ttl=None: response
+    )
+    calls = []
+    to_array = data_elements._data_table_to_array
+
+    def counting_to_array(table):
+        calls.append(table)
+        return to_array(table)
+
+    monkeypatch.setattr(data_elements, "_data_table_to_array", counting_to_array)
+
+    user_info = LabFolderUserInfo()
+    user_info.user_id = "u1"
+    table = TableElement(user_info, element_id="t1")
+
+    assert len(calls) == 1
+    assert isinstance(table.table["S"], pd.DataFrame)
+    assert table.table["S"].columns.tolist() == ["h"]
+    assert table.table["S"]["h"].tolist() == [1.0]